@@ -5,32 +5,45 @@ import os
 import sys
 
 from .config import load_config, save_config
-from .generator import GenerationError, IGGenerator
-from .ig_resource import IGResourceGenerator
-from .initializer import IGInitializer
 from .logger import make_printer
-from .validator import IGInputValidator
 
 _printer = make_printer()
 
+_BANNER = "=" * 70
+_RULE = "-" * 40
+
+# The CLI never changes directory, so one getcwd syscall serves all handlers.
+_CWD = None
+
+
+def _cwd():
+    global _CWD
+    if _CWD is None:
+        _CWD = os.getcwd()
+    return _CWD
+
 
 # ---------------------------------------------------------------------------
 # Sub-command handlers
 # ---------------------------------------------------------------------------
 
 def cmd_init(args):
-    path = args.path or os.path.join(os.getcwd(), "input")
+    from .initializer import IGInitializer
+
+    path = args.path or os.path.join(_cwd(), "input")
     path = os.path.abspath(path)
     guide_name = args.name or "My Implementation Guide"
     style_name = args.style or "custom"
 
-    _printer("=" * 70)
-    _printer("Simplifier.net IG Input Initialization")
-    _printer("=" * 70)
-    _printer(f"Output folder: {path}")
-    _printer(f"Guide name: {guide_name}")
-    _printer(f"Style name: {style_name}")
-    _printer("")
+    _printer(
+        _BANNER,
+        "Simplifier.net IG Input Initialization",
+        _BANNER,
+        f"Output folder: {path}",
+        f"Guide name: {guide_name}",
+        f"Style name: {style_name}",
+        "",
+    )
 
     init = IGInitializer(path, guide_name, style_name, _printer)
     result = init.initialize(force=args.force)
@@ -45,10 +58,11 @@ def cmd_init(args):
             _printer(f"  - {e}")
         return 1
 
-    # Save path to config
+    # Save path to config (only when it actually changed)
     cfg = load_config()
-    cfg["InputPath"] = path
-    save_config(cfg)
+    if cfg.get("InputPath") != path:
+        cfg["InputPath"] = path
+        save_config(cfg)
 
     _printer("")
     _printer("IG input structure initialized successfully!")
@@ -58,14 +72,18 @@ def cmd_init(args):
 
 
 def cmd_validate(args):
-    path = args.input or os.path.join(os.getcwd(), "input")
+    from .validator import IGInputValidator
+
+    path = args.input or os.path.join(_cwd(), "input")
     path = os.path.abspath(path)
 
-    _printer("=" * 70)
-    _printer("Simplifier.net IG Input Validation")
-    _printer("=" * 70)
-    _printer(f"Input folder: {path}")
-    _printer("")
+    _printer(
+        _BANNER,
+        "Simplifier.net IG Input Validation",
+        _BANNER,
+        f"Input folder: {path}",
+        "",
+    )
 
     validator = IGInputValidator(path, _printer)
     result = validator.validate()
@@ -96,10 +114,11 @@ def cmd_validate(args):
     if result.get("has_fsh_input"):
         _printer(f"   - FSH source files: {result.get('fsh_file_count', 0)} files")
 
-    # Save path to config
+    # Save path to config (only when it actually changed)
     cfg = load_config()
-    cfg["InputPath"] = path
-    save_config(cfg)
+    if cfg.get("InputPath") != path:
+        cfg["InputPath"] = path
+        save_config(cfg)
 
     _printer("")
     _printer(f"Validation complete - input structure is valid")
@@ -109,11 +128,15 @@ def cmd_validate(args):
 
 
 def cmd_generate(args):
+    from .generator import GenerationError, IGGenerator
+    from .ig_resource import IGResourceGenerator
+
+    cfg = load_config()
+
     # Determine input path
     if args.input:
         input_path = os.path.abspath(args.input)
     else:
-        cfg = load_config()
         input_path = cfg.get("InputPath")
         if not input_path:
             _printer("No input path specified.")
@@ -144,15 +167,16 @@ def cmd_generate(args):
     if args.output:
         output_path = os.path.abspath(args.output)
     else:
-        cfg = load_config()
         output_folder = cfg.get("DefaultOutputFolder", "guides")
-        output_path = os.path.join(os.getcwd(), output_folder)
-
-    _printer("=" * 70)
-    _printer("Simplifier.net IG Generation")
-    _printer("=" * 70)
-    _printer(f"Input: {input_path}")
-    _printer(f"Output: {output_path}")
+        output_path = os.path.join(_cwd(), output_folder)
+
+    _printer(
+        _BANNER,
+        "Simplifier.net IG Generation",
+        _BANNER,
+        f"Input: {input_path}",
+        f"Output: {output_path}",
+    )
     if generate_ig_resource:
         _printer("ImplementationGuide resource: Yes")
     _printer("")
@@ -193,21 +217,21 @@ def cmd_generate(args):
 
 
 def cmd_ig_resource(args):
+    from .ig_resource import IGResourceGenerator
+
     # Determine guide output path
     if args.path:
         guide_output_path = os.path.abspath(args.path)
     else:
         cfg = load_config()
-        guides_folder = os.path.join(os.getcwd(), cfg.get("DefaultOutputFolder", "guides"))
-        if not os.path.isdir(guides_folder):
+        guides_folder = os.path.join(_cwd(), cfg.get("DefaultOutputFolder", "guides"))
+        try:
+            it = os.scandir(guides_folder)
+        except (FileNotFoundError, NotADirectoryError):
             _printer("No guides folder found. Run 'simplifier-ig generate' first.")
             return 1
-
-        guide_folders = [
-            os.path.join(guides_folder, d)
-            for d in os.listdir(guides_folder)
-            if os.path.isdir(os.path.join(guides_folder, d))
-        ]
+        with it:
+            guide_folders = [entry.path for entry in it if entry.is_dir(follow_symlinks=False)]
 
         if not guide_folders:
             _printer("No generated IGs found in guides folder. Run 'simplifier-ig generate' first.")
@@ -224,11 +248,13 @@ def cmd_ig_resource(args):
         _printer(f"IG output folder not found: {guide_output_path}")
         return 1
 
-    _printer("=" * 70)
-    _printer("ImplementationGuide Resource Generation")
-    _printer("=" * 70)
-    _printer(f"IG Output: {guide_output_path}")
-    _printer("")
+    _printer(
+        _BANNER,
+        "ImplementationGuide Resource Generation",
+        _BANNER,
+        f"IG Output: {guide_output_path}",
+        "",
+    )
 
     # Get input path
     input_path = args.input
@@ -254,26 +280,30 @@ def cmd_ig_resource(args):
 
 def cmd_config(args):
     cfg = load_config()
-    _printer("IG Configuration")
-    _printer("-" * 40)
+    _printer("IG Configuration", _RULE)
     _printer(f"Input path: {cfg.get('InputPath', '(not set)')}")
     _printer(f"Default output folder: {cfg.get('DefaultOutputFolder', 'guides')}")
 
     input_path = cfg.get("InputPath")
-    if input_path and os.path.isdir(input_path):
+    if input_path:
+        # One directory read replaces the isdir probe and both isfile probes;
+        # nothing is touched at all when no input path is configured.
+        try:
+            with os.scandir(input_path) as it:
+                names = {e.name for e in it if e.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
+            _printer(f"[WARNING] Input path does not exist: {input_path}")
+            return 0
+
         _printer("")
         _printer("Input folder exists and is accessible.")
-        guide_yaml = os.path.join(input_path, "guide.yaml")
-        variables_yaml = os.path.join(input_path, "variables.yaml")
-        if os.path.isfile(guide_yaml) and os.path.isfile(variables_yaml):
+        if "guide.yaml" in names and "variables.yaml" in names:
             _printer("Required configuration files are present.")
         else:
-            if not os.path.isfile(guide_yaml):
+            if "guide.yaml" not in names:
                 _printer("[WARNING] guide.yaml not found in input folder")
-            if not os.path.isfile(variables_yaml):
+            if "variables.yaml" not in names:
                 _printer("[WARNING] variables.yaml not found in input folder")
-    elif input_path:
-        _printer(f"[WARNING] Input path does not exist: {input_path}")
 
     return 0
 
@@ -290,52 +320,80 @@ def cmd_clear(args):
 # Main entry point
 # ---------------------------------------------------------------------------
 
-def main():
-    parser = argparse.ArgumentParser(
-        prog="simplifier-ig",
-        description="Simplifier.net IG CLI Tool — generate Implementation Guide structures",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+def _add_init_arguments(p):
+    p.add_argument("--path", type=str, default=None, help="Path where the IG input structure will be created (default: ./input)")
+    p.add_argument("--name", type=str, default=None, help="Name for the Implementation Guide (default: 'My Implementation Guide')")
+    p.add_argument("--style", type=str, default=None, help="Name of the style folder to create (default: 'custom')")
+    p.add_argument("--force", action="store_true", help="Allow initialization in a non-empty directory")
+
+
+def _add_validate_arguments(p):
+    p.add_argument("--input", type=str, default=None, help="Path to the input folder (default: ./input)")
 
-    # -- init --
-    p_init = subparsers.add_parser("init", help="Initialize a new IG input folder structure")
-    p_init.add_argument("--path", type=str, default=None, help="Path where the IG input structure will be created (default: ./input)")
-    p_init.add_argument("--name", type=str, default=None, help="Name for the Implementation Guide (default: 'My Implementation Guide')")
-    p_init.add_argument("--style", type=str, default=None, help="Name of the style folder to create (default: 'custom')")
-    p_init.add_argument("--force", action="store_true", help="Allow initialization in a non-empty directory")
-
-    # -- validate --
-    p_validate = subparsers.add_parser("validate", help="Validate and set the IG input folder")
-    p_validate.add_argument("--input", type=str, default=None, help="Path to the input folder (default: ./input)")
-
-    # -- generate --
-    p_generate = subparsers.add_parser("generate", help="Generate a Simplifier-compliant IG from input folder")
-    p_generate.add_argument("--input", type=str, default=None, help="Path to the input folder (optional if previously set)")
-    p_generate.add_argument("--output", type=str, default=None, help="Path to the output folder (default: ./guides)")
-    p_generate.add_argument("--skip-validation", action="store_true", help="Skip input validation")
-    p_generate.add_argument(
+
+def _add_generate_arguments(p):
+    p.add_argument("--input", type=str, default=None, help="Path to the input folder (optional if previously set)")
+    p.add_argument("--output", type=str, default=None, help="Path to the output folder (default: ./guides)")
+    p.add_argument("--skip-validation", action="store_true", help="Skip input validation")
+    p.add_argument(
         "--no-ig-resource",
         action="store_true",
         help="Do NOT generate an ImplementationGuide.json resource file (generated by default)",
     )
 
-    # -- ig-resource --
-    p_ig_resource = subparsers.add_parser("ig-resource", help="Generate an ImplementationGuide.json resource from IG output")
-    p_ig_resource.add_argument("--path", type=str, default=None, help="Path to the generated IG output folder")
-    p_ig_resource.add_argument("--input", type=str, default=None, help="Path to the input folder (for resource collection)")
 
-    # -- config --
-    subparsers.add_parser("config", help="Show current IG configuration")
+def _add_ig_resource_arguments(p):
+    p.add_argument("--path", type=str, default=None, help="Path to the generated IG output folder")
+    p.add_argument("--input", type=str, default=None, help="Path to the input folder (for resource collection)")
 
-    # -- clear --
-    subparsers.add_parser("clear", help="Clear saved IG configuration")
 
-    args = parser.parse_args()
+# command name -> (help text, argument registration)
+_COMMANDS = {
+    "init": ("Initialize a new IG input folder structure", _add_init_arguments),
+    "validate": ("Validate and set the IG input folder", _add_validate_arguments),
+    "generate": ("Generate a Simplifier-compliant IG from input folder", _add_generate_arguments),
+    "ig-resource": ("Generate an ImplementationGuide.json resource from IG output", _add_ig_resource_arguments),
+    "config": ("Show current IG configuration", None),
+    "clear": ("Clear saved IG configuration", None),
+}
 
-    if not args.command:
-        parser.print_help()
-        return 1
+
+def _build_full_parser():
+    parser = argparse.ArgumentParser(
+        prog="simplifier-ig",
+        description="Simplifier.net IG CLI Tool — generate Implementation Guide structures",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    for name, (help_text, add_arguments) in _COMMANDS.items():
+        sub = subparsers.add_parser(name, help=help_text)
+        if add_arguments:
+            add_arguments(sub)
+    return parser
+
+
+def main():
+    argv = sys.argv[1:]
+    command = argv[0] if argv else None
+    spec = _COMMANDS.get(command)
+
+    if spec is None:
+        # Help, no command, or unknown command: build the full parser so
+        # argparse can render help / report the invalid choice.
+        parser = _build_full_parser()
+        args = parser.parse_args(argv)
+        if not args.command:
+            parser.print_help()
+            return 1
+    else:
+        # Fast path: a recognized command gets a single lightweight parser,
+        # skipping add_subparsers and the other commands entirely.
+        help_text, add_arguments = spec
+        parser = argparse.ArgumentParser(prog=f"simplifier-ig {command}", description=help_text)
+        if add_arguments:
+            add_arguments(parser)
+        args = parser.parse_args(argv[1:])
+        args.command = command
 
     dispatch = {
         "init": cmd_init,
@@ -1,33 +1,83 @@
 """Configuration persistence helpers."""
 
 import json
+import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+try:  # optional C-level JSON codec
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 
 CONFIG_DIR = ".simplifier"
 CONFIG_FILE = "ig-generation.settings.json"
 
+# Parsed config cached for the lifetime of the process; a single CLI
+# invocation may call load_config() several times.
+_CACHE: Optional[Dict[str, Any]] = None
+# Snapshot of what is on disk; callers mutate the cached dict in place, so
+# save_config compares against this copy to detect no-op saves.
+_SAVED_STATE: Optional[Dict[str, Any]] = None
+_RESOLVED_PATH: Optional[Path] = None
+
 
 def _config_path() -> Path:
     """Return the path to the config file in the current working directory."""
-    return Path.cwd() / CONFIG_DIR / CONFIG_FILE
+    global _RESOLVED_PATH
+    if _RESOLVED_PATH is None:
+        _RESOLVED_PATH = Path.cwd() / CONFIG_DIR / CONFIG_FILE
+    return _RESOLVED_PATH
+
+
+def _reset_config_path() -> None:
+    """Forget the cached config path (and parsed config). Intended for tests."""
+    global _RESOLVED_PATH, _CACHE, _SAVED_STATE
+    _RESOLVED_PATH = None
+    _CACHE = None
+    _SAVED_STATE = None
 
 
 def load_config() -> Dict[str, Any]:
     """Load persisted IG configuration."""
+    global _CACHE, _SAVED_STATE
+    if _CACHE is not None:
+        return _CACHE
     path = _config_path()
-    if path.exists():
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return {}
-    return {}
+    try:
+        # EAFP: reading directly avoids a separate exists() stat
+        _CACHE = _loads(path.read_bytes())
+    except Exception:
+        _CACHE = {}
+    _SAVED_STATE = dict(_CACHE)
+    return _CACHE
 
 
 def save_config(cfg: Dict[str, Any]) -> None:
     """Save IG configuration to disk."""
+    global _CACHE, _SAVED_STATE
+    if cfg == _SAVED_STATE:
+        _CACHE = cfg
+        return
     path = _config_path()
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(cfg, f, indent=2)
+    # Serialize fully, write to a sibling temp file, then rename into place
+    # so a crash mid-save can never leave a truncated config behind.
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(_dumps(cfg))
+    os.replace(tmp_path, path)
+    _CACHE = cfg
+    _SAVED_STATE = dict(cfg)
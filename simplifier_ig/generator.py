@@ -1,22 +1,229 @@
 """Generates Implementation Guide structure for Simplifier.net publishing."""
 
 import json
+import os
 import re
 import shutil
+import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from json.decoder import scanstring
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from .models import new_generation_result
-from .utils import is_subpath
+from .utils import list_json_files, reflink_or_copy
 from .validator import IGInputValidator
-from .yaml_helpers import dump_yaml, load_yaml
+from .yaml_helpers import load_yaml
+
+try:
+    # orjson decodes large resources several times faster than stdlib json
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - optional dependency
+    _json_loads = json.loads
 
 
 class GenerationError(Exception):
     pass
 
 
+# Artifact generation is I/O bound; size the pool for syscall overlap
+_MAX_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# Top-level string fields needed from a FHIR resource file
+_FHIR_HEADER_KEYS = frozenset({"resourceType", "id", "url", "kind"})
+
+# Read this much before deciding whether the rest of the file is needed
+_HEADER_CHUNK = 1 << 16
+
+_JSON_WS = " \t\n\r"
+
+# Display-name substitution for toc entries ('-'/'_' become spaces)
+_TITLE_TRANS = str.maketrans("-_", "  ")
+
+
+def _scan_fhir_header(text: str) -> Optional[Dict[str, str]]:
+    """Extract top-level string values for the FHIR header keys without a full parse.
+
+    Walks the document's top-level object, decoding strings with the C
+    scanner and skipping nested containers by bracket counting, stopping as
+    soon as every header key has been seen. Returns None for documents whose
+    top level is not an object. Raises IndexError/ValueError on malformed or
+    truncated input; callers fall back to a full json.loads then.
+    """
+    found: Dict[str, str] = {}
+    i = 0
+    while text[i] in _JSON_WS:
+        i += 1
+    if text[i] != "{":
+        return None
+    i += 1
+    while True:
+        while text[i] in _JSON_WS:
+            i += 1
+        if text[i] == "}":
+            return found
+        if text[i] != '"':
+            raise ValueError("expected object key")
+        key, i = scanstring(text, i + 1)
+        while text[i] in _JSON_WS:
+            i += 1
+        if text[i] != ":":
+            raise ValueError("expected ':'")
+        i += 1
+        while text[i] in _JSON_WS:
+            i += 1
+        c = text[i]
+        if c == '"':
+            value, i = scanstring(text, i + 1)
+            if key in _FHIR_HEADER_KEYS:
+                found[key] = value
+                if len(found) == len(_FHIR_HEADER_KEYS):
+                    return found
+        elif c == "{" or c == "[":
+            # Skip a nested container without decoding it
+            depth = 1
+            i += 1
+            while depth:
+                c = text[i]
+                if c == '"':
+                    _, i = scanstring(text, i + 1)
+                    continue
+                if c == "{" or c == "[":
+                    depth += 1
+                elif c == "}" or c == "]":
+                    depth -= 1
+                i += 1
+        else:
+            # Number / true / false / null — scan to the end of the token
+            while text[i] not in ",}" and text[i] not in _JSON_WS:
+                i += 1
+        while text[i] in _JSON_WS:
+            i += 1
+        if text[i] == ",":
+            i += 1
+        elif text[i] == "}":
+            return found
+        else:
+            raise ValueError("expected ',' or '}'")
+
+
+@lru_cache(maxsize=4096)
+def _parse_fhir_header_cached(path_str: str, mtime_ns: int, size: int) -> Optional[Dict[str, str]]:
+    """Read the FHIR header fields of *path_str*, memoized on (path, mtime, size)."""
+    try:
+        with open(path_str, "r", encoding="utf-8") as f:
+            text = f.read(_HEADER_CHUNK)
+            try:
+                header = _scan_fhir_header(text)
+            except (IndexError, ValueError):
+                header = None
+            if len(text) == _HEADER_CHUNK and (header is None or _FHIR_HEADER_KEYS - header.keys()):
+                # Possibly truncated mid-scan: read the rest and retry
+                text += f.read()
+                try:
+                    header = _scan_fhir_header(text)
+                except (IndexError, ValueError):
+                    header = None
+    except OSError:
+        return None
+
+    if header is None:
+        # Malformed for the scanner; let the real parser decide
+        try:
+            resource = _json_loads(text)
+            header = {k: resource[k] for k in _FHIR_HEADER_KEYS if isinstance(resource.get(k), str)}
+        except Exception:
+            return None
+
+    rt = header.get("resourceType")
+    rid = header.get("id")
+    if not rt or not rid:
+        return None
+    return {
+        "resourceType": rt,
+        "id": rid,
+        "filename": os.path.splitext(os.path.basename(path_str))[0],
+        "filepath": path_str,
+        "url": header.get("url", ""),
+        "kind": header.get("kind", ""),
+        "page_filename": rid + ".page.md",
+    }
+
+
+# {{ig-var: variable-name }} placeholders in page templates; the lazy group
+# with surrounding \s* keeps the captured name pre-stripped.
+_IG_VAR_RE = re.compile(r"\{\{ig-var:\s*([^}]+?)\s*\}\}")
+
+
+def _render_tokens(tokens: List[str], variables: Dict[str, str]) -> str:
+    """Render a template pre-split by _IG_VAR_RE.
+
+    Even indices hold literal text, odd indices hold variable names.
+    Unknown variables are re-emitted as their placeholder so they stay
+    visible in the generated page.
+    """
+    if len(tokens) == 1:
+        return tokens[0]
+    out = [tokens[0]]
+    append = out.append
+    for i in range(1, len(tokens), 2):
+        name = tokens[i]
+        append(variables.get(name, "{{ig-var: " + name + " }}"))
+        append(tokens[i + 1])
+    return "".join(out)
+
+
+def _write_file_bytes(path: Path, data: bytes) -> None:
+    """Write *data* to *path* through a raw fd, skipping the io stack."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+_YAML_CTRL_ESCAPES = {"\n": "\\n", "\t": "\\t", "\r": "\\r"}
+
+
+def _yaml_dq(value: str) -> str:
+    """Escape *value* for use inside a double-quoted YAML scalar.
+
+    The replace chain covers the common case; control characters would
+    otherwise be emitted raw and get mangled by YAML line folding, so
+    they fall back to explicit \\x/\\u escapes.
+    """
+    value = value.replace("\\", "\\\\").replace('"', '\\"')
+    if value.isprintable() or not value:
+        return value
+    return "".join(
+        ch
+        if ch.isprintable()
+        else _YAML_CTRL_ESCAPES.get(ch)
+        or (f"\\x{ord(ch):02X}" if ord(ch) <= 0xFF else f"\\u{ord(ch):04X}")
+        for ch in value
+    )
+
+
+def _scandir_files(root):
+    """Recursively yield DirEntry objects for all regular files under *root*.
+
+    DirEntry type checks reuse metadata from the directory read, avoiding the
+    per-entry stat calls that Path.rglob incurs. File symlinks are followed,
+    like the rglob walk this replaced; only directory symlinks are skipped,
+    as a guard against traversal loops.
+    """
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_files(entry.path)
+            elif entry.is_file():
+                yield entry
+
+
 class IGGenerator:
     """Generates Implementation Guide structure for Simplifier.net publishing."""
 
@@ -27,8 +234,10 @@ class IGGenerator:
         self._guide_name = ""
         self._guide_output_dir: Optional[Path] = None
         self._guide_config: Optional[Dict] = None
+        self._menu_actions: Optional[List[tuple]] = None
         self._variables_config: Optional[Dict] = None
-        self._templates: Dict[str, str] = {}
+        # Templates are stored pre-split into literal/variable token lists
+        self._templates: Dict[str, List[str]] = {}
         self._templates_dir: Optional[Path] = None
         self._artifacts_dir: Optional[Path] = None
 
@@ -70,18 +279,18 @@ class IGGenerator:
             self._copy_pagetemplates()
 
             # Step 7: Generate artifact pages
-            resources_by_type, examples = self._generate_artifacts()
+            resources_by_type, examples, rt_lower = self._generate_artifacts()
             result["resource_count"] = sum(len(v) for v in resources_by_type.values())
             result["example_count"] = len(examples)
 
             # Step 8: Copy artifact index pages (only for types that have resources)
-            index_pages = self._copy_artifact_index_pages(resources_by_type, examples)
+            index_pages = self._copy_artifact_index_pages(resources_by_type, examples, rt_lower)
 
             # Step 9: Generate toc.yaml files
             result["toc_files_generated"] = self._generate_toc_files()
 
             # Step 10: Generate artifacts toc
-            self._generate_artifacts_toc(resources_by_type, examples, index_pages)
+            self._generate_artifacts_toc(resources_by_type, examples, index_pages, rt_lower)
 
             result["success"] = True
 
@@ -100,7 +309,7 @@ class IGGenerator:
     # -- config loading --
 
     def _load_guide_config(self):
-        config = load_yaml(self._input_dir / "guide.yaml")
+        config = load_yaml(self._input_dir / "guide.yaml", json_cache=True)
         if not config:
             raise GenerationError("guide.yaml is empty or invalid")
         self._guide_config = config
@@ -113,10 +322,37 @@ class IGGenerator:
             raise GenerationError("url-key is empty in guide.yaml")
 
         if "menu" in config:
+            self._menu_actions = self._build_menu_actions(config["menu"])
             self._log("\n[MENU] Loaded menu configuration from guide.yaml")
         else:
             self._log("\n[WARNING] No menu configuration found in guide.yaml")
 
+    @staticmethod
+    def _build_menu_actions(menu) -> Optional[List[tuple]]:
+        """Normalize the menu dict into (kind, display name, payload) actions.
+
+        The isinstance/lower/replace classification work happens once here at
+        config-load time rather than during TOC generation. Kinds: 'folder'
+        (payload is the folder name), 'page' (payload is the transformed page
+        filename), 'submenu' (payload is the nested menu dict).
+        """
+        if not isinstance(menu, dict):
+            return None
+        actions: List[tuple] = []
+        for display_name, value in menu.items():
+            display_name = str(display_name)
+            if isinstance(value, bool):
+                if value:
+                    actions.append(("folder", display_name, display_name.lower()))
+            elif isinstance(value, str):
+                if value.lower().endswith(".md"):
+                    actions.append(("page", display_name, value.replace(".md", ".page.md")))
+                else:
+                    actions.append(("folder", display_name, value))
+            elif isinstance(value, dict):
+                actions.append(("submenu", display_name, value))
+        return actions
+
     def _load_variables_config(self):
         var_path = self._input_dir / "variables.yaml"
         if not var_path.exists():
@@ -151,7 +387,9 @@ class IGGenerator:
         for resource_type, template_file in template_files.items():
             tp = self._templates_dir / template_file
             if tp.is_file():
-                self._templates[resource_type] = tp.read_text(encoding="utf-8")
+                # Split on placeholders once at load; rendering is then a
+                # join, with no regex work per page.
+                self._templates[resource_type] = _IG_VAR_RE.split(tp.read_text(encoding="utf-8"))
                 self._log(f"   Loaded template: {template_file}")
 
         self._log(f"[OK] Loaded {len(self._templates)} templates")
@@ -186,23 +424,23 @@ class IGGenerator:
 
         guide_yaml = self._input_dir / "guide.yaml"
         if guide_yaml.is_file():
-            shutil.copy2(guide_yaml, self._guide_output_dir / "guide.yaml")
+            reflink_or_copy(guide_yaml, self._guide_output_dir / "guide.yaml")
             self._log("[OK] Copied guide.yaml")
 
         variables_yaml = self._input_dir / "variables.yaml"
         if variables_yaml.is_file():
-            shutil.copy2(variables_yaml, self._guide_output_dir / "variables.yaml")
+            reflink_or_copy(variables_yaml, self._guide_output_dir / "variables.yaml")
             self._log("[OK] Copied variables.yaml")
 
         styles_dir = self._input_dir / "styles"
         if styles_dir.is_dir():
-            shutil.copytree(styles_dir, self._guide_output_dir / "styles")
+            shutil.copytree(styles_dir, self._guide_output_dir / "styles", copy_function=reflink_or_copy)
             self._log("[OK] Copied styles directory")
 
         images_dir = self._input_dir / "images"
         if images_dir.is_dir():
             dest = self._guide_output_dir / "Home" / "images"
-            shutil.copytree(images_dir, dest)
+            shutil.copytree(images_dir, dest, copy_function=reflink_or_copy)
             # Simplifier requires a toc.yaml even for non-navigable folders
             self._write_toc_file(dest / "toc.yaml", [])
             self._log("[OK] Copied images directory")
@@ -218,19 +456,26 @@ class IGGenerator:
             raise GenerationError(f"Pages directory not found: {pages_dir}")
 
         file_count = 0
-        for item in pages_dir.rglob("*"):
-            if not item.is_file():
-                continue
-            relative = item.relative_to(pages_dir)
+        # Files cluster by directory, so remember which parents exist and
+        # issue one mkdir per directory instead of one per file.
+        created: Set[str] = set()
+
+        for entry in _scandir_files(pages_dir):
+            relative = Path(entry.path).relative_to(pages_dir)
+            name = entry.name
 
-            if item.suffix.lower() == ".md":
-                new_name = item.stem.lower() + ".page.md"
+            if name.lower().endswith(".md"):
+                new_name = name[:-3].lower() + ".page.md"
                 out_path = home_dir / relative.parent / new_name
             else:
                 out_path = home_dir / relative
 
-            out_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(item, out_path)
+            parent = out_path.parent
+            parent_str = str(parent)
+            if parent_str not in created:
+                parent.mkdir(parents=True, exist_ok=True)
+                created.add(parent_str)
+            shutil.copy2(entry.path, out_path)
             file_count += 1
 
         self._log(f"[OK] Transformed and copied {file_count} files")
@@ -245,6 +490,7 @@ class IGGenerator:
             output_pt = self._guide_output_dir / "Home" / "pagetemplates"
             output_pt.mkdir(parents=True, exist_ok=True)
             count = 0
+            created: Set[str] = {str(output_pt)}
             for item in pt_dir.rglob("*"):
                 if not item.is_file():
                     continue
@@ -254,8 +500,12 @@ class IGGenerator:
                     out_path = output_pt / relative.parent / new_name
                 else:
                     out_path = output_pt / relative
-                out_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(item, out_path)
+                parent = out_path.parent
+                parent_str = str(parent)
+                if parent_str not in created:
+                    parent.mkdir(parents=True, exist_ok=True)
+                    created.add(parent_str)
+                reflink_or_copy(item, out_path)
                 count += 1
             self._log(f"[OK] Copied {count} page templates (renamed .md -> .page.md)")
             # Simplifier requires a toc.yaml even for non-navigable folders
@@ -264,44 +514,20 @@ class IGGenerator:
     # -- FHIR resource parsing (JSON only) --
 
     @staticmethod
-    def _parse_fhir_resource(file_path: Path) -> Optional[Dict[str, str]]:
+    def _parse_fhir_resource(file_path) -> Optional[Dict[str, str]]:
         """Parse a FHIR JSON resource, returning {resourceType, id, filename, url} or None."""
-        if file_path.suffix.lower() != ".json":
+        path_str = os.fspath(file_path)
+        if not path_str.lower().endswith(".json"):
             return None
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                resource = json.load(f)
-            rt = resource.get("resourceType")
-            rid = resource.get("id")
-            if not rt or not rid:
-                return None
-            return {
-                "resourceType": rt,
-                "id": rid,
-                "filename": file_path.stem,
-                "filepath": str(file_path),
-                "url": resource.get("url", ""),
-                "kind": resource.get("kind", ""),
-            }
-        except Exception:
+            st = os.stat(path_str)
+        except OSError:
             return None
-
-    # -- template variable resolution --
-
-    @staticmethod
-    def _resolve_template_variables(template: str, variables: Dict[str, str]) -> str:
-        """Resolve {{ig-var: variable-name }} placeholders."""
-        pattern = r"\{\{ig-var:\s*([^}]+)\s*\}\}"
-
-        def _replace(m):
-            var_name = m.group(1).strip()
-            return variables.get(var_name, m.group(0))
-
-        return re.sub(pattern, _replace, template)
+        return _parse_fhir_header_cached(path_str, st.st_mtime_ns, st.st_size)
 
     # -- artifacts --
 
-    def _generate_artifacts(self) -> Tuple[Dict[str, List], List]:
+    def _generate_artifacts(self) -> Tuple[Dict[str, List], List, Dict[str, str]]:
         self._log("\n[ARTIFACTS] Generating artifact pages...")
         artifacts_dir = self._artifacts_dir
         artifacts_dir.mkdir(parents=True, exist_ok=True)
@@ -323,10 +549,51 @@ class IGGenerator:
         # Resources whose type has no artifact template are treated as examples
         example_overflow: List[Dict] = []
 
+        pool = ThreadPoolExecutor(max_workers=_MAX_WORKERS)
+        write_futures = []
+        resource_count = 0
+
+        # Per-type render state, built lazily on a type's first resource:
+        # (type directory, template tokens or None for fallback content)
+        type_state: Dict[str, tuple] = {}
+        rt_lower: Dict[str, str] = {}
+
+        def _write_resource_page(resource_type: str, info: Dict[str, str]) -> None:
+            state = type_state.get(resource_type)
+            if state is None:
+                folder = sys.intern(resource_type.lower())
+                rt_lower[resource_type] = folder
+                type_dir = artifacts_dir / folder
+                type_dir.mkdir(exist_ok=True)
+                template = self._templates.get(resource_type)
+                if not (template and any(template)):
+                    template = None
+                state = type_state[resource_type] = (type_dir, template)
+            type_dir, template = state
+
+            if template is not None:
+                variables = {
+                    "file-name": info["id"],
+                    f"{info['resourceType']}.url": info.get("url", ""),
+                }
+                content = _render_tokens(template, variables)
+            else:
+                content = (
+                    f"# {info['id']}\n\n"
+                    f"*Resource Type: {resource_type}*\n\n"
+                    f"<!-- No template found for {resource_type} -->\n"
+                )
+            page_path = type_dir / info["page_filename"]
+            write_futures.append(pool.submit(_write_file_bytes, page_path, content.encode("utf-8")))
+
         for scan_dir in [resources_dir, fsh_resources_dir]:
             if scan_dir.is_dir():
-                for rf in sorted(scan_dir.glob("*.json")):
-                    info = self._parse_fhir_resource(rf)
+                # Parse headers in parallel; the loop below consumes results
+                # in file order so dedup/classification stay deterministic.
+                # Each resource is rendered and queued for writing as soon as
+                # it is classified; only the fields the TOC pass needs are
+                # kept around.
+                for info in pool.map(self._parse_fhir_resource, list_json_files(scan_dir)):
                     if info:
                         key = (info["resourceType"], info["id"])
                         if key not in seen_resource_ids:
@@ -337,7 +604,11 @@ class IGGenerator:
                                 classified_type = "Logical"
 
                             if classified_type in self._templates:
-                                resources_by_type[classified_type].append(info)
+                                _write_resource_page(classified_type, info)
+                                resources_by_type[classified_type].append(
+                                    {"id": info["id"], "page_filename": info["page_filename"]}
+                                )
+                                resource_count += 1
                             else:
                                 # No artifact template for this type — treat as example
                                 example_overflow.append(info)
@@ -345,87 +616,76 @@ class IGGenerator:
                         else:
                             self._log(f"   Skipped duplicate: {info['resourceType']}/{info['id']} from {scan_dir.name}")
 
-        resource_count = 0
+        # Sort each type's entries by id once; TOC generation relies on it
         for resource_type in sorted(resources_by_type):
             resources = resources_by_type[resource_type]
-            type_dir = artifacts_dir / resource_type.lower()
-            type_dir.mkdir(exist_ok=True)
-
-            template = self._templates.get(resource_type, "")
-
-            for resource in resources:
-                page_name = f"{resource['id']}.page.md"
-                page_path = type_dir / page_name
-
-                variables = {
-                    "file-name": resource["id"],
-                    f"{resource['resourceType']}.url": resource.get("url", ""),
-                }
-
-                if template:
-                    content = self._resolve_template_variables(template, variables)
-                else:
-                    content = (
-                        f"# {resource['id']}\n\n"
-                        f"*Resource Type: {resource_type}*\n\n"
-                        f"<!-- No template found for {resource_type} -->\n"
-                    )
-
-                page_path.write_text(content, encoding="utf-8")
-                resource_count += 1
-
+            resources.sort(key=lambda r: r["id"])
             self._log(f"   Created {len(resources)} {resource_type} artifact pages")
 
         # Process examples (from input/examples/ and resources without templates)
         examples_dir = self._input_dir / "examples"
         examples_list: List[Dict] = []
 
-        # Collect examples from input/examples/ directory
-        if examples_dir.is_dir():
-            for ef in sorted(examples_dir.glob("*.json")):
-                info = self._parse_fhir_resource(ef)
-                if info:
-                    examples_list.append(info)
-
-        # Merge in resources that had no artifact template
-        examples_list.extend(example_overflow)
-
-        if examples_list:
-            examples_artifact_dir = artifacts_dir / "examples"
-            examples_artifact_dir.mkdir(exist_ok=True)
-
-            example_template = self._templates.get("Example", "")
+        example_state: Optional[tuple] = None
 
-            for info in examples_list:
-                page_name = f"{info['id']}.page.md"
-                page_path = examples_artifact_dir / page_name
+        def _write_example_page(info: Dict[str, str]) -> None:
+            nonlocal example_state
+            if example_state is None:
+                examples_artifact_dir = artifacts_dir / "examples"
+                examples_artifact_dir.mkdir(exist_ok=True)
+                example_template = self._templates.get("Example")
+                if not (example_template and any(example_template)):
+                    example_template = None
+                example_state = (examples_artifact_dir, example_template)
+            examples_artifact_dir, example_template = example_state
 
+            if example_template is not None:
                 variables = {
                     "file-name": info["id"],
                     "Resource.id": info["id"],
                     "ResourceType/Resource.id": f"{info['resourceType']}/{info['id']}",
                 }
+                content = _render_tokens(example_template, variables)
+            else:
+                content = (
+                    f"# {info['id']}\n\n"
+                    f"*Example of {info['resourceType']}*\n\n"
+                    f"<!-- No template found for examples -->\n"
+                )
+            page_path = examples_artifact_dir / info["page_filename"]
+            write_futures.append(pool.submit(_write_file_bytes, page_path, content.encode("utf-8")))
+
+        # Examples from input/examples/, then resources with no artifact
+        # template — each written as soon as it is seen.
+        if examples_dir.is_dir():
+            for info in pool.map(self._parse_fhir_resource, list_json_files(examples_dir)):
+                if info:
+                    _write_example_page(info)
+                    examples_list.append({"id": info["id"], "page_filename": info["page_filename"]})
 
-                if example_template:
-                    content = self._resolve_template_variables(example_template, variables)
-                else:
-                    content = (
-                        f"# {info['id']}\n\n"
-                        f"*Example of {info['resourceType']}*\n\n"
-                        f"<!-- No template found for examples -->\n"
-                    )
+        for info in example_overflow:
+            _write_example_page(info)
+            examples_list.append({"id": info["id"], "page_filename": info["page_filename"]})
 
-                page_path.write_text(content, encoding="utf-8")
+        # Id order, matching the per-type lists
+        examples_list.sort(key=lambda e: e["id"])
 
+        if examples_list:
             self._log(f"   Created {len(examples_list)} example artifact pages")
 
+        # Surface any write error before reporting success
+        for future in write_futures:
+            future.result()
+        pool.shutdown()
+
         self._log(f"[OK] Generated {resource_count + len(examples_list)} artifact pages")
-        return dict(resources_by_type), examples_list
+        return dict(resources_by_type), examples_list, rt_lower
 
     def _copy_artifact_index_pages(
         self,
         resources_by_type: Dict[str, List],
         examples_list: List,
+        rt_lower: Dict[str, str],
     ) -> Dict[str, bool]:
         self._log("\n[ARTIFACTS] Copying artifact index pages...")
         index_pages: Dict[str, bool] = {}
@@ -435,7 +695,7 @@ class IGGenerator:
             return index_pages
 
         # Build set of artifact type folder names that actually have resources
-        active_types = {rt.lower() for rt in resources_by_type if resources_by_type[rt]}
+        active_types = {rt_lower[rt] for rt in resources_by_type if resources_by_type[rt]}
         if examples_list:
             active_types.add("examples")
 
@@ -466,7 +726,18 @@ class IGGenerator:
     # -- TOC generation --
 
     def _write_toc_file(self, path: Path, entries: List[Dict[str, str]]):
-        dump_yaml(entries, path)
+        # Every toc.yaml is a flat list of name/filename string pairs, so we
+        # emit the YAML directly instead of going through the PyYAML emitter.
+        if not entries:
+            # An empty file parses as YAML null; Simplifier needs a sequence.
+            path.write_bytes(b"[]\n")
+            return
+        lines = []
+        for entry in entries:
+            name = _yaml_dq(entry["name"])
+            filename = _yaml_dq(entry["filename"])
+            lines.append(f'- name: "{name}"\n  filename: "{filename}"\n')
+        path.write_bytes("".join(lines).encode("utf-8"))
 
     def _generate_toc_files(self) -> int:
         self._log("\n[TOC] Generating table of contents files...")
@@ -483,21 +754,23 @@ class IGGenerator:
 
         # Subdirectory toc.yaml (skip pagetemplates and artifacts subtree)
         home_dir = self._guide_output_dir / "Home"
-        artifacts_path = self._artifacts_dir
+        artifacts_path = str(self._artifacts_dir)
 
-        for current_dir in sorted(home_dir.rglob("*")):
-            if not current_dir.is_dir():
-                continue
-            dir_name = current_dir.name
+        for dirpath, dirnames, _filenames in os.walk(home_dir):
+            # Prune only the real artifacts subtree, matched by full path so
+            # a user page folder that happens to be named "artifacts" still
+            # gets its toc; os.walk never descends into pruned names.
+            dirnames[:] = [d for d in dirnames if os.path.join(dirpath, d) != artifacts_path]
+            dirnames.sort()
 
-            # Skip pagetemplates and anything under artifacts
-            if dir_name == "pagetemplates":
-                continue
-            if is_subpath(current_dir, artifacts_path):
-                continue
+            current_dir = Path(dirpath)
 
-            # Skip directories already handled by nested menu config
-            if current_dir in menu_configured_dirs:
+            # Home/toc.yaml itself was written above; also skip directories
+            # already handled by nested menu config, and pagetemplates
+            # folders whose (empty) toc was written when they were copied.
+            if current_dir == home_dir or current_dir in menu_configured_dirs:
+                continue
+            if current_dir.name == "pagetemplates":
                 continue
 
             entries = self._generate_toc_for_directory(current_dir)
@@ -515,32 +788,40 @@ class IGGenerator:
         home_toc: List[Dict[str, str]] = []
         menu_configured_dirs: Set[Path] = set()
 
-        menu = self._guide_config.get("menu") if self._guide_config else None
-        if isinstance(menu, dict):
-            for display_name, value in menu.items():
-                display_name = str(display_name)
-
-                if isinstance(value, bool) and value:
-                    folder_name = display_name.lower()
-                    if (home_dir / folder_name).is_dir():
-                        home_toc.append({"name": display_name, "filename": folder_name})
-
-                elif isinstance(value, str):
-                    if value.lower().endswith(".md"):
-                        page_name = value.replace(".md", ".page.md")
-                        if (home_dir / page_name).is_file():
-                            home_toc.append({"name": display_name, "filename": page_name})
-                    else:
-                        if (home_dir / value).is_dir():
-                            home_toc.append({"name": display_name, "filename": value})
-
-                elif isinstance(value, dict):
-                    folder_name = self._resolve_submenu_folder(value)
+        # One directory snapshot answers all per-menu-entry type probes
+        with os.scandir(home_dir) as it:
+            entries_by_name = {e.name: e for e in it}
+
+        def _is_dir(name: str) -> bool:
+            entry = entries_by_name.get(name)
+            if entry is not None:
+                return entry.is_dir()
+            # Names with separators point below the top level; stat those
+            return "/" in name and (home_dir / name).is_dir()
+
+        def _is_file(name: str) -> bool:
+            entry = entries_by_name.get(name)
+            if entry is not None:
+                return entry.is_file()
+            return "/" in name and (home_dir / name).is_file()
+
+        if self._menu_actions is not None:
+            for kind, display_name, payload in self._menu_actions:
+                if kind == "folder":
+                    if _is_dir(payload):
+                        home_toc.append({"name": display_name, "filename": payload})
+
+                elif kind == "page":
+                    if _is_file(payload):
+                        home_toc.append({"name": display_name, "filename": payload})
+
+                else:  # submenu
+                    folder_name = self._resolve_submenu_folder(payload)
                     if folder_name:
                         home_toc.append({"name": display_name, "filename": folder_name})
-                        subdir = home_dir / folder_name
-                        if subdir.is_dir():
-                            self._generate_submenu_toc(subdir, value)
+                        if _is_dir(folder_name):
+                            subdir = home_dir / folder_name
+                            self._generate_submenu_toc(subdir, payload)
                             menu_configured_dirs.add(subdir)
 
             if home_toc:
@@ -593,38 +874,42 @@ class IGGenerator:
             self._log(f"   Generated {rel}/toc.yaml ({len(entries)} entries) from menu config")
 
     def _generate_toc_for_directory(self, directory: Path) -> List[Dict[str, str]]:
-        entries: List[Dict[str, str]] = []
-        files: List[Path] = []
-        dirs: List[Path] = []
-
-        for item in directory.iterdir():
-            name = item.name
-            if name == "toc.yaml" or name == "pagetemplates":
-                continue
-            if item.is_file() and name.endswith(".page.md"):
-                files.append(item)
-            elif item.is_dir() and not name.startswith(".") and not name.startswith("_"):
-                dirs.append(item)
+        files: List[str] = []
+        dirs: List[str] = []
+
+        # Single scandir pass; DirEntry type checks come from the readdir
+        # data, so no per-entry stat or Path allocation is needed.
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                if name == "toc.yaml" or name == "pagetemplates":
+                    continue
+                if name.endswith(".page.md") and entry.is_file():
+                    files.append(name)
+                elif name[0] not in "._" and entry.is_dir():
+                    dirs.append(name)
 
         # Sort: index first, then alphabetical
-        files.sort(key=lambda f: (0 if f.name.lower() == "index.page.md" else 1, f.name))
-        dirs.sort(key=lambda d: d.name)
+        files.sort(key=lambda n: (n.lower() != "index.page.md", n))
+        dirs.sort()
+
+        entries: List[Dict[str, str]] = []
+        entries_append = entries.append
 
-        for f in files:
-            stem = f.name.replace(".page.md", "")
+        for name in files:
+            stem = name[: -len(".page.md")]
             if stem.lower() == "index":
                 display = "Index"
             else:
-                display = stem.replace("-", " ").replace("_", " ").title()
-            entries.append({"name": display, "filename": f.name})
+                display = stem.translate(_TITLE_TRANS).title()
+            entries_append({"name": display, "filename": name})
 
-        for d in dirs:
-            dn = d.name
-            if dn.lower() == "artifacts":
+        for name in dirs:
+            if name.lower() == "artifacts":
                 display = "Artifacts"
             else:
-                display = dn.replace("-", " ").replace("_", " ").title()
-            entries.append({"name": display, "filename": dn})
+                display = name.translate(_TITLE_TRANS).title()
+            entries_append({"name": display, "filename": name})
 
         return entries
 
@@ -633,17 +918,20 @@ class IGGenerator:
         resources_by_type: Dict[str, List],
         examples_list: List,
         index_pages: Dict[str, bool],
+        rt_lower: Dict[str, str],
     ):
         self._log("\n[TOC] Generating Artifacts table of contents...")
         artifacts_dir = self._artifacts_dir
 
+        sorted_types = sorted(resources_by_type)
+
         # Main artifacts toc
         artifacts_toc: List[Dict[str, str]] = []
         if (artifacts_dir / "index.page.md").is_file():
             artifacts_toc.append({"name": "Index", "filename": "index.page.md"})
 
-        for rt in sorted(resources_by_type):
-            artifacts_toc.append({"name": rt, "filename": rt.lower()})
+        for rt in sorted_types:
+            artifacts_toc.append({"name": rt, "filename": rt_lower[rt]})
 
         if examples_list:
             artifacts_toc.append({"name": "Examples", "filename": "examples"})
@@ -651,20 +939,21 @@ class IGGenerator:
         self._write_toc_file(artifacts_dir / "toc.yaml", artifacts_toc)
         self._log("   Generated artifacts/toc.yaml")
 
-        # Per resource type
-        for rt in sorted(resources_by_type):
+        # Per resource type (lists are already id-sorted by _generate_artifacts)
+        for rt in sorted_types:
             resources = resources_by_type[rt]
-            type_dir = artifacts_dir / rt.lower()
+            folder = rt_lower[rt]
+            type_dir = artifacts_dir / folder
             type_toc: List[Dict[str, str]] = []
 
-            if index_pages.get(rt.lower()):
+            if index_pages.get(folder):
                 type_toc.append({"name": "Index", "filename": "index.page.md"})
 
-            for resource in sorted(resources, key=lambda r: r["id"]):
-                type_toc.append({"name": resource["id"], "filename": f"{resource['id']}.page.md"})
+            for resource in resources:
+                type_toc.append({"name": resource["id"], "filename": resource["page_filename"]})
 
             self._write_toc_file(type_dir / "toc.yaml", type_toc)
-            self._log(f"   Generated artifacts/{rt.lower()}/toc.yaml ({len(type_toc)} entries)")
+            self._log(f"   Generated artifacts/{folder}/toc.yaml ({len(type_toc)} entries)")
 
         # Examples
         if examples_list:
@@ -674,8 +963,8 @@ class IGGenerator:
             if index_pages.get("examples"):
                 ex_toc.append({"name": "Index", "filename": "index.page.md"})
 
-            for ex in sorted(examples_list, key=lambda e: e["id"]):
-                ex_toc.append({"name": ex["id"], "filename": f"{ex['id']}.page.md"})
+            for ex in examples_list:
+                ex_toc.append({"name": ex["id"], "filename": ex["page_filename"]})
 
             self._write_toc_file(ex_dir / "toc.yaml", ex_toc)
             self._log(f"   Generated artifacts/examples/toc.yaml ({len(ex_toc)} entries)")
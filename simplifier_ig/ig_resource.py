@@ -1,23 +1,206 @@
 """Generates an ImplementationGuide.json FHIR resource (R4 format)."""
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, partial
+from json.decoder import scanstring
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from .utils import format_title
+from .utils import format_title, list_json_files
 from .yaml_helpers import load_yaml
 
+try:
+    # orjson serializes dict/list-heavy payloads several times faster than
+    # stdlib json and emits bytes directly.
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # pragma: no cover - optional dependency
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+# Resource parsing is I/O bound; size the pool for syscall overlap
+_MAX_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+
+# Value extraction dispatches on the concrete decoded type (always str,
+# list, or dict straight out of the JSON decoder) — one dict lookup
+# instead of an isinstance cascade per resource.
+
+def _human_name_from_list(value: list) -> Optional[str]:
+    # List of HumanName – pick the first usable entry
+    for hn in value:
+        if isinstance(hn, dict):
+            if hn.get("text"):
+                return str(hn["text"])
+            parts: List[str] = []
+            given = hn.get("given")
+            if isinstance(given, list):
+                parts.extend(str(g) for g in given)
+            family = hn.get("family")
+            if family:
+                parts.append(str(family))
+            if parts:
+                return " ".join(parts)
+        elif isinstance(hn, str):
+            return hn
+    return None
+
+
+def _human_name_from_dict(value: dict) -> Optional[str]:
+    if value.get("text"):
+        return str(value["text"])
+    return None
+
+
+_HUMAN_NAME_DISPATCH = {
+    str: lambda v: v,
+    list: _human_name_from_list,
+    dict: _human_name_from_dict,
+}
+
+
+def _codeable_text_from_dict(value: dict) -> Optional[str]:
+    # CodeableConcept: prefer .text, then first coding.display
+    if value.get("text"):
+        return str(value["text"])
+    codings = value.get("coding")
+    if isinstance(codings, list):
+        for coding in codings:
+            if isinstance(coding, dict) and coding.get("display"):
+                return str(coding["display"])
+    return None
+
+
+def _codeable_text_from_list(value: list) -> Optional[str]:
+    # Unexpected list – try elements in order
+    for item in value:
+        handler = _CODEABLE_TEXT_DISPATCH.get(type(item))
+        result = handler(item) if handler else None
+        if result:
+            return result
+    return None
+
+
+_CODEABLE_TEXT_DISPATCH = {
+    str: lambda v: v,
+    list: _codeable_text_from_list,
+    dict: _codeable_text_from_dict,
+}
+
+# Top-level fields an IG resource entry is built from
+_SCAN_KEYS = frozenset({"resourceType", "id", "url", "name", "description", "meta"})
+
+# Allowed ImplementationGuide.status codes (FHIR publication-status)
+_VALID_STATUSES = frozenset({"draft", "active", "retired", "unknown"})
+
+_JSON_WS = " \t\n\r"
+
+
+def _scan_top_level(text: str) -> Optional[Dict[str, Any]]:
+    """Extract the _SCAN_KEYS fields from a JSON document's top-level object.
+
+    Walks the top level with the C string scanner and only decodes values we
+    need; other nested containers (e.g. a Bundle's entry array) are skipped
+    by bracket counting without materializing them. Returns None when the
+    top level is not an object; raises IndexError/ValueError on malformed or
+    truncated input, in which case callers fall back to a full decode.
+    """
+    found: Dict[str, Any] = {}
+    i = 0
+    while text[i] in _JSON_WS:
+        i += 1
+    if text[i] != "{":
+        return None
+    i += 1
+    while True:
+        while text[i] in _JSON_WS:
+            i += 1
+        if text[i] == "}":
+            return found
+        if text[i] != '"':
+            raise ValueError("expected object key")
+        key, i = scanstring(text, i + 1)
+        while text[i] in _JSON_WS:
+            i += 1
+        if text[i] != ":":
+            raise ValueError("expected ':'")
+        i += 1
+        while text[i] in _JSON_WS:
+            i += 1
+        wanted = key in _SCAN_KEYS and key not in found
+        c = text[i]
+        if c == '"':
+            value, i = scanstring(text, i + 1)
+            if wanted:
+                found[key] = value
+        elif c == "{" or c == "[":
+            start = i
+            depth = 1
+            i += 1
+            while depth:
+                c = text[i]
+                if c == '"':
+                    _, i = scanstring(text, i + 1)
+                    continue
+                if c == "{" or c == "[":
+                    depth += 1
+                elif c == "}" or c == "]":
+                    depth -= 1
+                i += 1
+            if wanted:
+                found[key] = _loads(text[start:i])
+        else:
+            # Number / true / false / null — scan to the end of the token
+            start = i
+            while text[i] not in ",}" and text[i] not in _JSON_WS:
+                i += 1
+            if wanted:
+                found[key] = _loads(text[start:i])
+        if len(found) == len(_SCAN_KEYS):
+            return found
+        while text[i] in _JSON_WS:
+            i += 1
+        if text[i] == ",":
+            i += 1
+        elif text[i] == "}":
+            return found
+        else:
+            raise ValueError("expected ',' or '}'")
+
 
 class IGResourceGenerator:
     """Generates an ImplementationGuide.json FHIR resource (R4 format)."""
 
     def __init__(self, guide_output_dir: str, input_dir: Optional[str] = None, log=None):
-        self._guide_output_dir = Path(guide_output_dir).resolve()
-        self._input_dir = Path(input_dir).resolve() if input_dir else None
+        # Keep the raw strings; resolve() walks every path component with
+        # stat calls, so it is deferred until a path is actually used.
+        self._guide_output_dir_str = guide_output_dir
+        self._input_dir_str = input_dir
         self._log = log or (lambda msg: None)
         self._config: Optional[Dict[str, str]] = None
         self._resources: List[Dict[str, Any]] = []
 
+    @cached_property
+    def _guide_output_dir(self) -> Path:
+        return Path(self._guide_output_dir_str).resolve()
+
+    @cached_property
+    def _input_dir(self) -> Optional[Path]:
+        return Path(self._input_dir_str).resolve() if self._input_dir_str else None
+
     # -- static validation --
 
     @staticmethod
@@ -44,7 +227,7 @@ class IGResourceGenerator:
             status_val = config.get("status")
             if status_val:
                 sv = str(status_val).strip().lower()
-                if sv not in {"draft", "active", "retired", "unknown"}:
+                if sv not in _VALID_STATUSES:
                     errors.append(f"Invalid status value '{sv}'. Must be one of: draft, active, retired, unknown")
         except Exception as e:
             errors.append(f"Error parsing guide.yaml: {e}")
@@ -70,8 +253,8 @@ class IGResourceGenerator:
                 result["errors"].append(f"Home directory not found: {home_dir}")
                 return result
 
-            root_page = self._build_page_structure(home_dir, "Home")
-            result["page_count"] = self._count_pages(root_page)
+            page_records = self._build_page_structure(home_dir, "Home")
+            result["page_count"] = len(page_records)
             self._log(f"[IG-RESOURCE] Built page structure with {result['page_count']} pages")
 
             # Step 3: Collect resources from input
@@ -80,12 +263,11 @@ class IGResourceGenerator:
                 self._log(f"[IG-RESOURCE] Collected {len(self._resources)} resources for definition.resource")
 
             # Step 4: Build the IG resource as a dict (R4 format)
-            ig = self._create_ig_resource_r4(root_page)
+            ig = self._create_ig_resource_r4(page_records)
 
-            # Step 5: Write JSON
+            # Step 5: Write JSON in one buffer/one syscall
             output_path = self._guide_output_dir / "ImplementationGuide.json"
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(ig, f, indent=2, ensure_ascii=False)
+            output_path.write_bytes(_dumps(ig))
 
             result["output_path"] = str(output_path)
             result["success"] = True
@@ -105,6 +287,9 @@ class IGResourceGenerator:
             return
 
         try:
+            # No json_cache here: this is the copied guide.yaml inside the
+            # generated guide folder, and a sidecar written next to it
+            # would end up in the publishable tree.
             config = load_yaml(guide_yaml_path)
             if not config:
                 result["errors"].append("guide.yaml is empty or invalid")
@@ -134,137 +319,110 @@ class IGResourceGenerator:
         except Exception as e:
             result["errors"].append(f"Error reading guide.yaml: {e}")
 
-    def _build_page_structure(self, directory: Path, relative_path: str) -> Dict:
-        """Build a tree of PageNode dicts."""
-        dir_name = directory.name
-        page = {
-            "nameUrl": relative_path,
-            "title": format_title(dir_name),
-            "generation": "generated",
-            "children": [],
-        }
-
-        # .page.md files
-        files = sorted(
-            [f for f in directory.iterdir() if f.is_file() and f.name.endswith(".page.md")],
-            key=lambda f: (0 if f.name.lower() == "index.page.md" else 1, f.name),
-        )
-        for f in files:
-            title = format_title(f.name.replace(".page.md", ""))
-            page["children"].append({
-                "nameUrl": f"{relative_path}/{f.name}",
-                "title": title,
-                "generation": "markdown",
-                "children": [],
-            })
-
-        # subdirectories
-        subdirs = sorted(
-            [
-                d
-                for d in directory.iterdir()
-                if d.is_dir() and not d.name.startswith("_") and not d.name.startswith(".") and d.name != "pagetemplates"
-            ],
-            key=lambda d: d.name,
-        )
-        for sd in subdirs:
-            child = self._build_page_structure(sd, f"{relative_path}/{sd.name}")
-            page["children"].append(child)
-
-        return page
-
-    @staticmethod
-    def _count_pages(page: Dict) -> int:
-        count = 1
-        for child in page.get("children", []):
-            count += IGResourceGenerator._count_pages(child)
-        return count
+    def _build_page_structure(self, directory: Path, relative_path: str) -> List[Tuple[str, str, str, int]]:
+        """Build a flat preorder list of (nameUrl, title, generation, child_count).
+
+        Iterative worklist rather than recursion, with one os.scandir per
+        directory; DirEntry type checks reuse the readdir metadata instead
+        of statting each entry. The flat form makes counting a len() and
+        lets _pages_to_r4 rebuild the nesting in a single linear pass.
+        """
+        records: List[Tuple[str, str, str, int]] = []
+        stack = [(os.fspath(directory), relative_path, format_title(directory.name))]
+
+        while stack:
+            dir_path, rel, title = stack.pop()
+
+            files: List[str] = []
+            subdirs: List[str] = []
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.endswith(".page.md") and entry.is_file(follow_symlinks=False):
+                        files.append(name)
+                    elif (
+                        name[0] not in "._"
+                        and name != "pagetemplates"
+                        and entry.is_dir(follow_symlinks=False)
+                    ):
+                        subdirs.append(name)
+
+            files.sort(key=lambda n: (n.lower() != "index.page.md", n))
+            subdirs.sort()
+
+            records.append((rel, title, "generated", len(files) + len(subdirs)))
+            for name in files:
+                records.append((f"{rel}/{name}", format_title(name[: -len(".page.md")]), "markdown", 0))
+            # Reversed so the LIFO pop order keeps subdirectories (and their
+            # subtrees) in sorted preorder right after this directory's files.
+            for name in reversed(subdirs):
+                stack.append((os.path.join(dir_path, name), f"{rel}/{name}", format_title(name)))
+
+        return records
 
     def _collect_resources(self):
         self._resources.clear()
         if not self._input_dir:
             return
 
-        # Conformance resources (from resources/ and fsh-generated/resources/)
-        res_dir = self._input_dir / "resources"
-        fsh_res_dir = self._input_dir.parent / "fsh-generated" / "resources"
-        seen_ids: set = set()
-        for scan_dir in [res_dir, fsh_res_dir]:
-            if scan_dir.is_dir():
-                for f in sorted(scan_dir.glob("*.json")):
-                    entry = self._parse_resource_file(f, is_example=False)
+        # Parsing is I/O bound (the GIL is released during reads), so file
+        # parses overlap in a pool; pool.map preserves the sorted input
+        # order, keeping dedup and output deterministic.
+        pool = ThreadPoolExecutor(max_workers=_MAX_WORKERS)
+        try:
+            # Conformance resources (from resources/ and fsh-generated/resources/)
+            res_dir = self._input_dir / "resources"
+            fsh_res_dir = self._input_dir.parent / "fsh-generated" / "resources"
+            seen_ids: set = set()
+            parse_resource = partial(self._parse_resource_file, is_example=False)
+            for scan_dir in [res_dir, fsh_res_dir]:
+                if scan_dir.is_dir():
+                    for entry in pool.map(parse_resource, list_json_files(scan_dir)):
+                        if entry:
+                            key = (entry.get("resource", {}).get("reference", ""),)
+                            if key not in seen_ids:
+                                seen_ids.add(key)
+                                self._resources.append(entry)
+
+            # Examples
+            ex_dir = self._input_dir / "examples"
+            if ex_dir.is_dir():
+                parse_example = partial(self._parse_resource_file, is_example=True)
+                for entry in pool.map(parse_example, list_json_files(ex_dir)):
                     if entry:
-                        key = (entry.get("resource", {}).get("reference", ""),)
-                        if key not in seen_ids:
-                            seen_ids.add(key)
-                            self._resources.append(entry)
-
-        # Examples
-        ex_dir = self._input_dir / "examples"
-        if ex_dir.is_dir():
-            for f in sorted(ex_dir.glob("*.json")):
-                entry = self._parse_resource_file(f, is_example=True)
-                if entry:
-                    self._resources.append(entry)
+                        self._resources.append(entry)
+        finally:
+            pool.shutdown()
 
     @staticmethod
     def _extract_human_name(value: Any) -> Optional[str]:
         """Extract a readable name from a FHIR HumanName or list of HumanName."""
-        if isinstance(value, str):
-            return value
-        if isinstance(value, list):
-            # List of HumanName – pick the first entry
-            for hn in value:
-                if isinstance(hn, dict):
-                    if hn.get("text"):
-                        return str(hn["text"])
-                    parts: List[str] = []
-                    given = hn.get("given")
-                    if isinstance(given, list):
-                        parts.extend(str(g) for g in given)
-                    family = hn.get("family")
-                    if family:
-                        parts.append(str(family))
-                    if parts:
-                        return " ".join(parts)
-                elif isinstance(hn, str):
-                    return hn
-        if isinstance(value, dict):
-            if value.get("text"):
-                return str(value["text"])
-        return None
+        handler = _HUMAN_NAME_DISPATCH.get(type(value))
+        return handler(value) if handler else None
 
     @staticmethod
     def _extract_codeable_text(value: Any) -> Optional[str]:
         """Extract readable text from a FHIR CodeableConcept, Coding, or plain string."""
-        if isinstance(value, str):
-            return value
-        if isinstance(value, dict):
-            # CodeableConcept: prefer .text, then first coding.display
-            if value.get("text"):
-                return str(value["text"])
-            codings = value.get("coding")
-            if isinstance(codings, list):
-                for coding in codings:
-                    if isinstance(coding, dict) and coding.get("display"):
-                        return str(coding["display"])
-        if isinstance(value, list):
-            # Unexpected list – try first element
-            for item in value:
-                result = IGResourceGenerator._extract_codeable_text(item)
-                if result:
-                    return result
-        return None
+        handler = _CODEABLE_TEXT_DISPATCH.get(type(value))
+        return handler(value) if handler else None
 
-    def _parse_resource_file(self, file_path: Path, is_example: bool) -> Optional[Dict[str, Any]]:
+    def _parse_resource_file(self, file_path, is_example: bool) -> Optional[Dict[str, Any]]:
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                resource = json.load(f)
+            # One read, then a header-only scan that skips payload arrays;
+            # a full decode only runs when the scanner rejects the document.
+            with open(file_path, "rb") as f:
+                data = f.read()
+            try:
+                resource = _scan_top_level(data.decode("utf-8"))
+            except (IndexError, ValueError):
+                resource = None
+            if resource is None:
+                resource = _loads(data)
 
             rt = resource.get("resourceType")
             rid = resource.get("id")
             if not rt or not rid:
-                self._log(f"[IG-RESOURCE] Warning: Skipping {file_path.name} - missing resourceType or id")
+                self._log(f"[IG-RESOURCE] Warning: Skipping {os.path.basename(file_path)} - missing resourceType or id")
                 return None
 
             entry: Dict[str, Any] = {
@@ -305,10 +463,10 @@ class IGResourceGenerator:
 
             return entry
         except Exception as e:
-            self._log(f"[IG-RESOURCE] Warning: Error parsing {file_path.name}: {e}")
+            self._log(f"[IG-RESOURCE] Warning: Error parsing {os.path.basename(file_path)}: {e}")
             return None
 
-    def _create_ig_resource_r4(self, root_page: Dict) -> Dict[str, Any]:
+    def _create_ig_resource_r4(self, page_records: List[Tuple[str, str, str, int]]) -> Dict[str, Any]:
         """Build an R4 ImplementationGuide resource as a plain dict."""
         cfg = self._config
         canonical = cfg["canonical"].rstrip("/")
@@ -357,19 +515,40 @@ class IGResourceGenerator:
                 res_list.append(entry)
             definition["resource"] = res_list
 
-        # definition.page (recursive)
-        definition["page"] = self._page_node_to_r4(root_page)
+        # definition.page
+        definition["page"] = self._pages_to_r4(page_records)
 
         ig["definition"] = definition
         return ig
 
-    def _page_node_to_r4(self, page: Dict) -> Dict[str, Any]:
-        node: Dict[str, Any] = {
-            "nameUrl": page["nameUrl"],
-            "title": page["title"],
-            "generation": page["generation"],
-        }
-        children = page.get("children", [])
-        if children:
-            node["page"] = [self._page_node_to_r4(c) for c in children]
-        return node
+    @staticmethod
+    def _pages_to_r4(page_records: List[Tuple[str, str, str, int]]) -> Dict[str, Any]:
+        """Rebuild the nested R4 page structure from preorder records.
+
+        A stack of [node, pending children] counters restores the nesting in
+        one linear pass, with no recursion.
+        """
+        root: Dict[str, Any] = {}
+        stack: List[List] = []
+
+        for name_url, title, generation, child_count in page_records:
+            node: Dict[str, Any] = {
+                "nameUrl": name_url,
+                "title": title,
+                "generation": generation,
+            }
+            if stack:
+                parent = stack[-1]
+                parent[0]["page"].append(node)
+                parent[1] -= 1
+            else:
+                root = node
+
+            if child_count:
+                node["page"] = []
+                stack.append([node, child_count])
+            else:
+                while stack and stack[-1][1] == 0:
+                    stack.pop()
+
+        return root
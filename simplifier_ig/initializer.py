@@ -1,12 +1,21 @@
 """Initializes a new IG input folder structure with template files."""
 
-import shutil
+import os
+import re
 import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .utils import sendfile_copy
 from .yaml_helpers import load_yaml
 
+# Placeholder lines in the template guide.yaml, replaced in one pass
+_GUIDE_DEFAULT_RE = re.compile(
+    r"title: My Implementation Guide"
+    r"|url-key: my-implementation-guide"
+    r"|style-name: custom"
+)
+
 
 class IGInitializer:
     """Initializes a new IG input folder structure with template files."""
@@ -146,43 +155,35 @@ class IGInitializer:
         # .simplifierupload goes in the project root (parent of the input folder)
         count += self._copy_template_file(template_base, ".simplifierupload", self._output_dir.parent, warnings)
 
-        # pages/
-        pages_tp = template_base / "pages"
-        pages_out = self._output_dir / "pages"
-        if pages_tp.is_dir():
-            for f in pages_tp.iterdir():
-                if f.is_file():
-                    count += self._copy_template_file(pages_tp, f.name, pages_out, warnings)
-
-        # pagetemplates-artifacts/
-        art_tp = template_base / "pagetemplates-artifacts"
-        art_out = self._output_dir / "pagetemplates-artifacts"
-        if art_tp.is_dir():
-            for f in art_tp.iterdir():
-                if f.is_file():
-                    count += self._copy_template_file(art_tp, f.name, art_out, warnings)
-
-        # pagetemplates/
-        pt_tp = template_base / "pagetemplates"
-        pt_out = self._output_dir / "pagetemplates"
-        if pt_tp.is_dir():
-            for f in pt_tp.iterdir():
-                if f.is_file():
-                    count += self._copy_template_file(pt_tp, f.name, pt_out, warnings)
+        # Template subfolders copied file-for-file into the input structure
+        for folder in ("pages", "pagetemplates-artifacts", "pagetemplates"):
+            count += self._copy_template_dir(template_base / folder, self._output_dir / folder, warnings)
 
         # styles — copy from template's first style folder into styles/{style_name}/
         styles_tp = template_base / "styles"
         if styles_tp.is_dir():
-            style_folders = [d for d in styles_tp.iterdir() if d.is_dir()]
+            with os.scandir(styles_tp) as it:
+                style_folders = sorted(e.name for e in it if e.is_dir())
             if style_folders:
-                source_style = style_folders[0]
+                source_style = styles_tp / style_folders[0]
                 style_out = self._output_dir / "styles" / self._style_name
-                for f in source_style.iterdir():
-                    if f.is_file():
-                        count += self._copy_template_file(source_style, f.name, style_out, warnings)
+                count += self._copy_template_dir(source_style, style_out, warnings)
 
         return count
 
+    def _copy_template_dir(self, src_dir: Path, dest_dir: Path, warnings: List[str]) -> int:
+        """Copy every regular file in *src_dir* into *dest_dir*."""
+        try:
+            it = os.scandir(src_dir)
+        except (FileNotFoundError, NotADirectoryError):
+            return 0
+        with it:
+            names = sorted(e.name for e in it if e.is_file())
+        count = 0
+        for name in names:
+            count += self._copy_template_file(src_dir, name, dest_dir, warnings)
+        return count
+
     def _copy_template_file(
         self, source_dir: Path, filename: str, dest_dir: Path, warnings: List[str]
     ) -> int:
@@ -190,12 +191,15 @@ class IGInitializer:
         dst = dest_dir / filename
         if not src.is_file():
             return 0
+        # relpath also handles files placed above the input dir,
+        # like .simplifierupload in the project root
+        rel = os.path.relpath(dst, self._output_dir)
         if dst.is_file():
-            self._log(f"   Skipped (exists): {dst.relative_to(self._output_dir)}")
+            self._log(f"   Skipped (exists): {rel}")
             return 0
         dest_dir.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src, dst)
-        self._log(f"   Created: {dst.relative_to(self._output_dir)}")
+        sendfile_copy(src, dst)
+        self._log(f"   Created: {rel}")
         return 1
 
     def _create_minimal_files(self) -> int:
@@ -287,11 +291,17 @@ class IGInitializer:
 
     def _customize_guide_yaml(self):
         guide_path = self._output_dir / "guide.yaml"
-        if not guide_path.is_file():
+        try:
+            content = guide_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
             return
-        content = guide_path.read_text(encoding="utf-8")
         url_key = self._guide_name.lower().replace(" ", "-")
-        content = content.replace("title: My Implementation Guide", f"title: {self._guide_name}")
-        content = content.replace("url-key: my-implementation-guide", f"url-key: {url_key}")
-        content = content.replace("style-name: custom", f"style-name: {self._style_name}")
-        guide_path.write_text(content, encoding="utf-8")
+        replacements = {
+            "title: My Implementation Guide": f"title: {self._guide_name}",
+            "url-key: my-implementation-guide": f"url-key: {url_key}",
+            "style-name: custom": f"style-name: {self._style_name}",
+        }
+        # Single combined-alternation scan instead of three replace() passes
+        customized = _GUIDE_DEFAULT_RE.sub(lambda m: replacements[m.group(0)], content)
+        if customized != content:
+            guide_path.write_text(customized, encoding="utf-8")
@@ -34,27 +34,35 @@ def _colorize(msg: str) -> str:
 
     # Separator lines: "=" * N  or  "-" * N
     if stripped and all(c == "=" for c in stripped):
-        return _SEPARATOR_COLOR + msg
+        return _SEPARATOR_COLOR + msg + Style.RESET_ALL
     if stripped and all(c == "-" for c in stripped):
-        return _SEPARATOR_COLOR + msg
+        return _SEPARATOR_COLOR + msg + Style.RESET_ALL
 
     # Status tags (may appear mid-line)
     for tag, color in _TAG_COLORS.items():
         if tag in msg:
-            return color + msg
+            return color + msg + Style.RESET_ALL
 
     # Section tags (always at line start)
     for tag in _SECTION_TAGS:
         if stripped.startswith(tag):
-            return _SECTION_COLOR + msg
+            return _SECTION_COLOR + msg + Style.RESET_ALL
 
     return msg
 
 
 def make_printer():
-    """Return a log callable that prints colorized output to stdout."""
+    """Return a log callable that prints colorized output to stdout.
 
-    def _printer(msg: str) -> None:
-        print(_colorize(msg))
+    Accepts one or more lines; multiple lines are colorized individually
+    but flushed as a single write.
+    """
+
+    # Bind the write method once; print() would re-resolve sys.stdout and
+    # process sep/end/flush arguments on every call.
+    write = sys.stdout.write
+
+    def _printer(*msgs: str) -> None:
+        write("\n".join(map(_colorize, msgs)) + "\n")
 
     return _printer
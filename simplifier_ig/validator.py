@@ -1,15 +1,71 @@
 """Validates Implementation Guide input structure for Simplifier.net publishing."""
 
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+import os
+import stat as stat_module
+import time
+from typing import Any, Dict, Iterator, List, Optional
 
 from .models import new_validation_result
-from .yaml_helpers import load_yaml
+from .yaml_helpers import load_yaml, load_yaml_shallow
+
+# Frozensets for the membership tests against the scandir snapshot;
+# the _SORTED tuples keep log and error messages in a stable order.
+REQUIRED_INPUT_FOLDERS = frozenset(("resources", "examples", "pages", "styles", "pagetemplates-artifacts"))
+REQUIRED_INPUT_FOLDERS_SORTED = ("resources", "examples", "pages", "styles", "pagetemplates-artifacts")
+OPTIONAL_INPUT_FOLDERS = ("images", "pagetemplates")
+REQUIRED_INPUT_FILES = frozenset(("guide.yaml",))
+REQUIRED_INPUT_FILES_SORTED = ("guide.yaml",)
+REQUIRED_STYLE_FILES = frozenset(("master.html", "settings.style", "style.css"))
+REQUIRED_STYLE_FILES_SORTED = ("master.html", "settings.style", "style.css")
+
+# How long a path observed to be absent is assumed to stay absent
+_NEGATIVE_TTL_S = 1.0
+
+
+def _stat_or_none(path) -> Optional[os.stat_result]:
+    """One stat call answering exists/is_dir/is_file at once."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _scandir_recursive(path) -> Iterator[os.DirEntry]:
+    """Yield every file DirEntry under *path*, depth-first.
+
+    DirEntry carries the type information from the readdir call itself, so
+    counting files this way skips the stat-per-entry that Path.rglob pays.
+    Symlinks are not followed; unreadable directories are skipped.
+    """
+    try:
+        it = os.scandir(path)
+    except PermissionError:
+        return
+    with it:
+        for entry in it:
+            if entry.is_symlink():
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_recursive(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
+
+def _norm(value) -> Optional[str]:
+    """Stripped string form of a config value, or None when blank/absent."""
+    if value is None:
+        return None
+    s = str(value).strip()
+    return s or None
+
 
-REQUIRED_INPUT_FOLDERS = ["resources", "examples", "pages", "styles", "pagetemplates-artifacts"]
-OPTIONAL_INPUT_FOLDERS = ["images", "pagetemplates"]
-REQUIRED_INPUT_FILES = ["guide.yaml"]
-REQUIRED_STYLE_FILES = ["master.html", "settings.style", "style.css"]
+def _count_suffix(path, suffix: str) -> int:
+    """Count regular files in *path* (non-recursive) whose name ends in *suffix*."""
+    try:
+        with os.scandir(path) as it:
+            return sum(1 for e in it if e.name.endswith(suffix) and e.is_file())
+    except OSError:
+        return 0
 
 
 class ValidationError(Exception):
@@ -19,19 +75,46 @@ class ValidationError(Exception):
 class IGInputValidator:
     """Validates Implementation Guide input structure for Simplifier.net publishing."""
 
+    # Optional inputs (variables.yaml, fsh-generated/) usually stay absent
+    # across watch-mode re-validations; remembering the miss skips the
+    # repeat stat. Keyed by absolute path -> monotonic timestamp.
+    _negative_cache: Dict[str, float] = {}
+
     def __init__(self, input_dir: str, log=None):
-        self._input_dir = Path(input_dir).resolve()
+        # Plain strings throughout: the validator only joins, stats and
+        # scans, so os.path is enough and skips PurePath construction.
+        # abspath is pure string work — no need to resolve symlinks just
+        # for logging and joining.
+        self._input_dir = os.path.abspath(input_dir)
+        self._guide_yaml = os.path.join(self._input_dir, "guide.yaml")
+        self._variables_yaml = os.path.join(self._input_dir, "variables.yaml")
+        self._fsh_generated_dir = os.path.join(
+            os.path.dirname(self._input_dir), "fsh-generated", "resources"
+        )
         self._log = log or (lambda msg: None)
+        self._log_active = log is not None
+        self._count_enabled = True
+        # Filled by _scan_input_tree; every later step reads from these
+        # instead of re-walking the input directory.
+        self._top_dirs: set = set()
+        self._top_files: set = set()
+        self._tree: Dict[str, Any] = {}
 
     # -- public --
 
-    def validate(self) -> Dict[str, Any]:
+    def validate(self, fresh: bool = False, *, count_files: bool = True) -> Dict[str, Any]:
+        if fresh:
+            self._negative_cache.clear()
+        self._count_enabled = count_files
         result = new_validation_result()
 
         try:
             # Step 1: input directory exists
             self._validate_input_directory()
 
+            # One pass over the tree; later steps consult the snapshot
+            self._scan_input_tree()
+
             # Step 2: required folders
             self._validate_required_folders(result)
 
@@ -56,8 +139,11 @@ class IGInputValidator:
             # Step 9: validate FSH input (if present)
             self._validate_fsh_input(result)
 
-            # Step 10: count files
-            result["file_counts"] = self._count_files(result.get("custom_styles_folder"))
+            # Step 10: count files (informational; skippable)
+            if count_files:
+                result["file_counts"] = self._count_files(result.get("custom_styles_folder"))
+            else:
+                result["file_counts"] = None
 
             # Step 11: check IG resource fields (informational)
             self._check_ig_resource_fields(result)
@@ -71,28 +157,121 @@ class IGInputValidator:
 
     # -- private --
 
+    def _is_missing(self, path: str) -> bool:
+        ts = self._negative_cache.get(path)
+        return ts is not None and time.monotonic() - ts < _NEGATIVE_TTL_S
+
+    def _mark_missing(self, path: str) -> None:
+        self._negative_cache[path] = time.monotonic()
+
+    def _fsh_generated_present(self) -> bool:
+        path = self._fsh_generated_dir
+        if self._is_missing(path):
+            return False
+        if os.path.isdir(path):
+            return True
+        self._mark_missing(path)
+        return False
+
     def _validate_input_directory(self):
-        if not self._input_dir.exists():
+        st = _stat_or_none(self._input_dir)
+        if st is None or not stat_module.S_ISDIR(st.st_mode):
             raise ValidationError(f"Input directory not found: {self._input_dir}")
         self._log(f"[INFO] Validating input directory: {self._input_dir}")
 
+    def _scan_input_tree(self):
+        """Bucket the whole input tree into counts and name sets in one walk.
+
+        validate() used to traverse the same directories three or four
+        times (required folders, optional folders, styles, counts); this
+        fills an in-memory snapshot once and the later steps read from it.
+        """
+        tree: Dict[str, Any] = {
+            "resources_json": 0,
+            "examples_json": 0,
+            "pages_md": 0,
+            "pagetemplates_md": 0,
+            "images_files": 0,
+            "fsh_files": 0,
+            # style folder name -> (file name set, total entry count)
+            "styles": {},
+        }
+        # Reset before refilling so a reused validator re-reads the disk
+        # instead of reporting the previous run's state.
+        self._top_dirs = set()
+        self._top_files = set()
+        self._tree = tree
+        try:
+            with os.scandir(self._input_dir) as it:
+                top = list(it)
+        except OSError:
+            # Unreadable input dir: leave the snapshot empty so the
+            # required-folder check raises its normal ValidationError.
+            return
+        for e in top:
+            if e.is_file():
+                self._top_files.add(e.name)
+                continue
+            if not e.is_dir():
+                continue
+            self._top_dirs.add(e.name)
+            name = e.name
+            # resources/examples/pages counts are informational only and
+            # skipped when the caller opts out of file counting; the rest
+            # feed validation decisions and are always gathered.
+            if name == "resources":
+                if self._count_enabled:
+                    tree["resources_json"] = _count_suffix(e.path, ".json")
+            elif name == "examples":
+                if self._count_enabled:
+                    tree["examples_json"] = _count_suffix(e.path, ".json")
+            elif name == "pages":
+                if self._count_enabled:
+                    tree["pages_md"] = sum(
+                        1 for f in _scandir_recursive(e.path) if f.name.endswith(".md")
+                    )
+            elif name == "pagetemplates":
+                tree["pagetemplates_md"] = _count_suffix(e.path, ".md")
+            elif name == "images":
+                # The count only ever appears in a log line, so the
+                # recursive walk is skipped when nobody is listening.
+                if self._log_active:
+                    tree["images_files"] = sum(1 for _ in _scandir_recursive(e.path))
+            elif name == "fsh":
+                tree["fsh_files"] = _count_suffix(e.path, ".fsh")
+            elif name == "styles":
+                try:
+                    with os.scandir(e.path) as sit:
+                        subdirs = [s for s in sit if s.is_dir()]
+                    for sub in subdirs:
+                        with os.scandir(sub.path) as fit:
+                            entries = list(fit)
+                        tree["styles"][sub.name] = (
+                            {c.name for c in entries if c.is_file()},
+                            len(entries),
+                        )
+                except OSError:
+                    pass
+
     def _validate_required_folders(self, result):
         self._log("[INFO] Checking required folders...")
-        missing = [f for f in REQUIRED_INPUT_FOLDERS if not (self._input_dir / f).is_dir()]
+        missing = sorted(REQUIRED_INPUT_FOLDERS - self._top_dirs)
         if missing:
             raise ValidationError(f"Missing required folders in input directory: {', '.join(missing)}")
-        self._log(f"[OK] Found required folders: {', '.join(REQUIRED_INPUT_FOLDERS)}")
+        self._log(f"[OK] Found required folders: {', '.join(REQUIRED_INPUT_FOLDERS_SORTED)}")
 
     def _validate_required_files(self, result):
         self._log("[INFO] Checking required files...")
-        missing = [f for f in REQUIRED_INPUT_FILES if not (self._input_dir / f).is_file()]
+        missing = sorted(REQUIRED_INPUT_FILES - self._top_files)
         if missing:
             raise ValidationError(f"Missing required files in input directory: {', '.join(missing)}")
-        self._log(f"[OK] Found required files: {', '.join(REQUIRED_INPUT_FILES)}")
+        self._log(f"[OK] Found required files: {', '.join(REQUIRED_INPUT_FILES_SORTED)}")
 
     def _load_guide_config(self, result) -> Dict[str, Any]:
         self._log("[INFO] Loading guide.yaml...")
-        config = load_yaml(self._input_dir / "guide.yaml")
+        # Shallow parse: validation stringifies every field it reads, so
+        # tag resolution would be wasted work here.
+        config = load_yaml_shallow(self._guide_yaml)
         if not config:
             raise ValidationError("guide.yaml is empty")
 
@@ -127,11 +306,15 @@ class IGInputValidator:
 
     def _load_variables_config(self, result) -> Optional[Dict]:
         self._log("[INFO] Looking for variables.yaml...")
-        var_path = self._input_dir / "variables.yaml"
-        if not var_path.exists():
+        if self._is_missing(self._variables_yaml):
+            self._log("[INFO] variables.yaml not found (optional file)")
+            return None
+        try:
+            config = load_yaml(self._variables_yaml)
+        except FileNotFoundError:
+            self._mark_missing(self._variables_yaml)
             self._log("[INFO] variables.yaml not found (optional file)")
             return None
-        config = load_yaml(var_path)
         if not config:
             self._log("[WARNING] variables.yaml is empty")
             return None
@@ -141,25 +324,22 @@ class IGInputValidator:
     def _check_optional_folders(self, result):
         self._log("[INFO] Checking optional folders...")
         for folder in OPTIONAL_INPUT_FOLDERS:
-            folder_path = self._input_dir / folder
-            if not folder_path.exists():
+            if folder not in self._top_dirs:
                 self._log(f"[INFO] Optional folder not found: {folder}")
                 continue
             if folder == "images":
                 result["has_images_folder"] = True
-                count = sum(1 for _ in folder_path.rglob("*") if _.is_file())
-                self._log(f"[OK] Found optional folder: {folder} ({count} files)")
+                self._log(f"[OK] Found optional folder: {folder} ({self._tree['images_files']} files)")
             elif folder == "pagetemplates":
-                md_files = list(folder_path.glob("*.md"))
-                if not md_files:
+                md_count = self._tree["pagetemplates_md"]
+                if not md_count:
                     result["warnings"].append(f"Optional folder '{folder}' is empty (no .md files found)")
                 else:
-                    self._log(f"[OK] Found optional folder: {folder} ({len(md_files)} template files)")
+                    self._log(f"[OK] Found optional folder: {folder} ({md_count} template files)")
 
         # Check for FSH-generated resources (at project root, sibling of input dir)
-        fsh_gen_dir = self._input_dir.parent / "fsh-generated" / "resources"
-        if fsh_gen_dir.is_dir():
-            fsh_count = len(list(fsh_gen_dir.glob("*.json")))
+        if self._fsh_generated_present():
+            fsh_count = _count_suffix(self._fsh_generated_dir, ".json")
             result["has_fsh_generated"] = True
             self._log(f"[OK] Found fsh-generated/resources ({fsh_count} JSON files)")
         else:
@@ -167,8 +347,7 @@ class IGInputValidator:
 
     def _validate_styles_structure(self, result):
         self._log("[INFO] Validating styles folder...")
-        styles_dir = self._input_dir / "styles"
-        if not styles_dir.is_dir():
+        if "styles" not in self._top_dirs:
             raise ValidationError(
                 "Required folder not found: styles\n"
                 "   This folder can be retrieved by downloading a Simplifier project that contains an IG."
@@ -178,8 +357,7 @@ class IGInputValidator:
         if not style_name:
             raise ValidationError("style-name not found in guide.yaml")
 
-        custom_dir = styles_dir / style_name
-        if not custom_dir.is_dir():
+        if style_name not in self._tree["styles"]:
             raise ValidationError(
                 f"Style folder not found: styles/{style_name}\n"
                 f"   The folder name must match the 'style-name' value in guide.yaml"
@@ -188,30 +366,27 @@ class IGInputValidator:
         result["custom_styles_folder"] = style_name
         self._log(f"[OK] Found styles folder: styles/{style_name}")
 
-        missing = [f for f in REQUIRED_STYLE_FILES if not (custom_dir / f).is_file()]
+        present, _entry_count = self._tree["styles"][style_name]
+        missing = sorted(REQUIRED_STYLE_FILES - present)
         if missing:
             raise ValidationError(
                 f"Missing required style files in styles/{style_name}: {', '.join(missing)}"
             )
 
-        self._log(f"[OK] All required style files present: {', '.join(REQUIRED_STYLE_FILES)}")
+        self._log(f"[OK] All required style files present: {', '.join(REQUIRED_STYLE_FILES_SORTED)}")
 
     def _validate_fsh_input(self, result):
         """Validate FSH input: if .fsh files exist, fsh-generated must be present."""
-        fsh_input_dir = self._input_dir / "fsh"
-        if not fsh_input_dir.is_dir():
-            return
-
-        fsh_files = list(fsh_input_dir.glob("*.fsh"))
-        if not fsh_files:
+        fsh_count = self._tree["fsh_files"]
+        if not fsh_count:
             return
 
-        self._log(f"[INFO] Found {len(fsh_files)} FSH source files in input/fsh/")
+        self._log(f"[INFO] Found {fsh_count} FSH source files in input/fsh/")
         result["has_fsh_input"] = True
-        result["fsh_file_count"] = len(fsh_files)
+        result["fsh_file_count"] = fsh_count
 
-        fsh_gen_dir = self._input_dir.parent / "fsh-generated" / "resources"
-        if not fsh_gen_dir.is_dir():
+        fsh_gen_dir = self._fsh_generated_dir
+        if not self._fsh_generated_present():
             result["errors"].append(
                 "FSH source files found in input/fsh/ but fsh-generated/resources/ "
                 "directory not found at the project root.\n"
@@ -221,39 +396,35 @@ class IGInputValidator:
             )
             return
 
-        json_files = list(fsh_gen_dir.glob("*.json"))
-        if not json_files:
+        json_count = _count_suffix(fsh_gen_dir, ".json")
+        if not json_count:
             result["warnings"].append(
                 "fsh-generated/resources/ exists but contains no JSON files. "
                 "Run SUSHI to generate FHIR resources from your FSH files."
             )
         else:
-            self._log(f"[OK] FSH pipeline validated: {len(fsh_files)} .fsh files -> {len(json_files)} generated resources")
+            self._log(f"[OK] FSH pipeline validated: {fsh_count} .fsh files -> {json_count} generated resources")
 
     def _count_files(self, custom_styles_folder: Optional[str]) -> Dict[str, int]:
+        tree = self._tree
         counts: Dict[str, int] = {}
-        res_dir = self._input_dir / "resources"
-        counts["resources"] = len(list(res_dir.glob("*.json"))) if res_dir.is_dir() else 0
+        counts["resources"] = tree["resources_json"]
 
-        fsh_dir = self._input_dir.parent / "fsh-generated" / "resources"
-        fsh_count = len(list(fsh_dir.glob("*.json"))) if fsh_dir.is_dir() else 0
+        # fsh-generated lives outside the input dir, so it is not part of
+        # the tree snapshot and still needs its own probe.
+        fsh_count = (
+            _count_suffix(self._fsh_generated_dir, ".json") if self._fsh_generated_present() else 0
+        )
         counts["fsh_generated_resources"] = fsh_count
         counts["resources"] += fsh_count
 
-        ex_dir = self._input_dir / "examples"
-        counts["examples"] = len(list(ex_dir.glob("*.json"))) if ex_dir.is_dir() else 0
+        counts["examples"] = tree["examples_json"]
+        counts["pages"] = tree["pages_md"]
 
-        pages_dir = self._input_dir / "pages"
-        counts["pages"] = len(list(pages_dir.rglob("*.md"))) if pages_dir.is_dir() else 0
+        style_entry = tree["styles"].get(custom_styles_folder) if custom_styles_folder else None
+        counts["styles"] = style_entry[1] if style_entry else 0
 
-        if custom_styles_folder:
-            cs_dir = self._input_dir / "styles" / custom_styles_folder
-            counts["styles"] = len(list(cs_dir.glob("*"))) if cs_dir.is_dir() else 0
-        else:
-            counts["styles"] = 0
-
-        pt_dir = self._input_dir / "pagetemplates"
-        counts["pagetemplates"] = len(list(pt_dir.glob("*.md"))) if pt_dir.is_dir() else 0
+        counts["pagetemplates"] = tree["pagetemplates_md"]
         return counts
 
     def _check_ig_resource_fields(self, result):
@@ -262,37 +433,26 @@ class IGInputValidator:
         valid_statuses = {"draft", "active", "retired", "unknown"}
         missing: List[str] = []
 
-        ig_id = config.get("id")
-        if ig_id and str(ig_id).strip():
-            result["ig_resource_id"] = str(ig_id).strip()
-        else:
-            missing.append("id")
-
-        status = config.get("status")
-        if status and str(status).strip():
-            sv = str(status).strip().lower()
-            if sv in valid_statuses:
-                result["ig_resource_status"] = sv
-            else:
-                result["warnings"].append(
-                    f"Invalid status value '{sv}' for IG resource generation. "
-                    f"Must be one of: draft, active, retired, unknown"
-                )
-                missing.append("status (invalid value)")
-        else:
-            missing.append("status")
-
-        fv = config.get("fhirVersion")
-        if fv and str(fv).strip():
-            result["ig_resource_fhir_version"] = str(fv).strip()
-        else:
-            missing.append("fhirVersion")
-
-        canonical = config.get("canonical")
-        if canonical and str(canonical).strip():
-            result["ig_resource_canonical"] = str(canonical).strip()
-        else:
-            missing.append("canonical")
+        for key, result_key in (
+            ("id", "ig_resource_id"),
+            ("status", "ig_resource_status"),
+            ("fhirVersion", "ig_resource_fhir_version"),
+            ("canonical", "ig_resource_canonical"),
+        ):
+            value = _norm(config.get(key))
+            if value is None:
+                missing.append(key)
+                continue
+            if key == "status":
+                value = value.lower()
+                if value not in valid_statuses:
+                    result["warnings"].append(
+                        f"Invalid status value '{value}' for IG resource generation. "
+                        f"Must be one of: draft, active, retired, unknown"
+                    )
+                    missing.append("status (invalid value)")
+                    continue
+            result[result_key] = value
 
         result["has_ig_resource_fields"] = len(missing) == 0
 
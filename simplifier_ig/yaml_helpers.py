@@ -1,20 +1,126 @@
-"""YAML I/O helpers (lazy-import so we fail gracefully when PyYAML is absent)."""
+"""YAML I/O helpers (guarded import so we fail gracefully when PyYAML is absent)."""
 
+import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
 
-def load_yaml(file_path: Path) -> Any:
-    """Load and parse a YAML file."""
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:  # pragma: no cover - optional dependency
+
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+try:
     import yaml
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    # Prefer the libyaml C implementations; fall back to the pure-Python
+    # loader/dumper when PyYAML was built without them.
+    _Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    _Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    # BaseLoader skips tag resolution entirely and returns plain strings —
+    # roughly half the work again when the caller stringifies anyway.
+    _ShallowLoader = getattr(yaml, "CBaseLoader", yaml.BaseLoader)
+    if _Loader is yaml.SafeLoader:  # pragma: no cover - depends on PyYAML build
+        import warnings
+
+        warnings.warn(
+            "PyYAML was built without libyaml; YAML parsing will be slow. "
+            "Reinstall PyYAML with the C extension for faster validation runs.",
+            stacklevel=2,
+        )
+except ImportError:  # pragma: no cover - exercised only without PyYAML
+    yaml = None
+
+
+@lru_cache(maxsize=64)
+def _load_yaml_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    # Binary mode: libyaml decodes UTF-8 itself, skipping the text layer.
+    with open(path_str, "rb") as f:
+        return yaml.load(f, Loader=_Loader)
+
+
+def load_yaml(file_path: Path, json_cache: bool = False) -> Any:
+    """Load and parse a YAML file.
+
+    Results are memoized on (path, mtime, size), so re-reading an unchanged
+    file — e.g. guide.yaml parsed by both validation and generation in one
+    run — costs a stat instead of a parse. Callers must not mutate the
+    returned object.
+
+    With *json_cache* a '<file>.cache.json' sidecar is maintained next to
+    the YAML file and read back on later runs while it is at least as new
+    as the source, turning repeated CLI startups into a JSON load.
+    """
+    if yaml is None:
+        raise ImportError("PyYAML is required to read YAML files")
+
+    st = os.stat(file_path)
+    path_str = os.fspath(file_path)
+
+    if json_cache:
+        cache_path = path_str + ".cache.json"
+        try:
+            if os.stat(cache_path).st_mtime_ns >= st.st_mtime_ns:
+                with open(cache_path, "rb") as f:
+                    return _json_loads(f.read())
+        except (OSError, ValueError):
+            pass
+        data = _load_yaml_cached(path_str, st.st_mtime_ns, st.st_size)
+        try:
+            tmp_path = cache_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(_json_dumps(data))
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError):
+            # Not JSON-representable or not writable — just skip the sidecar
+            pass
+        return data
+
+    return _load_yaml_cached(path_str, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=64)
+def _load_yaml_shallow_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    with open(path_str, "rb") as f:
+        return yaml.load(f, Loader=_ShallowLoader)
+
+
+def load_yaml_shallow(file_path) -> Any:
+    """Load a YAML file without tag resolution: every scalar comes back as str.
+
+    Suited to config files whose consumers stringify the values anyway
+    (like guide.yaml's top-level fields); use load_yaml where ints, bools
+    or null need their real types. Memoized like load_yaml.
+    """
+    if yaml is None:
+        raise ImportError("PyYAML is required to read YAML files")
+    st = os.stat(file_path)
+    return _load_yaml_shallow_cached(os.fspath(file_path), st.st_mtime_ns, st.st_size)
+
+
+def clear_cache() -> None:
+    """Drop all memoized YAML parses."""
+    _load_yaml_cached.cache_clear()
+    _load_yaml_shallow_cached.cache_clear()
 
 
 def dump_yaml(data: Any, file_path: Path) -> None:
     """Write *data* as YAML to *file_path*."""
-    import yaml
+    if yaml is None:
+        raise ImportError("PyYAML is required to write YAML files")
 
     with open(file_path, "w", encoding="utf-8") as f:
-        yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        yaml.dump(data, f, Dumper=_Dumper, default_flow_style=False, allow_unicode=True, sort_keys=False)